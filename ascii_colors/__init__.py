@@ -1,7 +1,11 @@
 import traceback
+import atexit
 import os
+import re
+import sys
 import threading
 import time
+from functools import lru_cache
 from typing import List, Union, Callable, Any, Optional
 
 def get_trace_exception(ex):
@@ -21,6 +25,47 @@ def trace_exception(ex):
     """
     ASCIIColors.error(get_trace_exception(ex))
 
+def _emit(payload, flush=False):
+    """
+    Writes an already assembled string to stdout in a single call
+
+    sys.stdout is looked up on each call so redirections keep working, and output is
+    silently dropped when there is no console (sys.stdout is None), as print() does.
+    When buffering is enabled, payloads are accumulated and written together
+    once the buffer is full or a flush is requested.
+    """
+    if ASCIIColors._buffer_size:
+        with ASCIIColors._buffer_lock:
+            ASCIIColors._buffer.append(payload)
+            ASCIIColors._buffer_len += len(payload)
+            if not flush and ASCIIColors._buffer_len < ASCIIColors._buffer_size:
+                return
+            payload = "".join(ASCIIColors._buffer)
+            ASCIIColors._buffer.clear()
+            ASCIIColors._buffer_len = 0
+            stream = sys.stdout
+            if stream is None:
+                return
+            stream.write(payload)
+            if flush:
+                stream.flush()
+        return
+    stream = sys.stdout
+    if stream is None:
+        return
+    stream.write(payload)
+    if flush:
+        stream.flush()
+
+@lru_cache(maxsize=128)
+def _compile_highlight(subtexts):
+    """
+    Builds the regex used by highlight for a tuple of subtexts, cached so repeated calls skip the compilation
+    """
+    # One alternation for all subtexts, longest first so they win over their prefixes
+    needles = sorted((st for st in subtexts if st), key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, needles))) if needles else None
+
 
 
 class ASCIIColors:
@@ -62,6 +107,16 @@ class ASCIIColors:
 
     # logging
     log_path = ""
+    _log_fd = None
+    _log_fd_path = ""
+    _log_lock = threading.Lock()
+
+    # output buffering (disabled when _buffer_size is 0)
+    _buffer = []
+    _buffer_len = 0
+    _buffer_size = 0
+    _buffer_lock = threading.Lock()
+    _flush_at_exit_registered = False
 
 
     @staticmethod
@@ -76,18 +131,74 @@ class ASCIIColors:
             end (str, optional): The string to print at the end. Defaults to a newline.
             flush (bool, optional): Whether to flush the output. Defaults to False.
         """
-        print(f"{style}{color}{text}{ASCIIColors.color_reset}", end=end, flush=flush)
+        if end is None:
+            # Same as the builtin print
+            end = "\n"
+        _emit(f"{style}{color}{text}{ASCIIColors.color_reset}{end}", flush)
+        ASCIIColors._write_log(f"{text}{end}")
+
+    @staticmethod
+    def _write_log(text):
+        """
+        Writes text to the log file when log_path is set, and releases the log file once logging is turned off.
+
+        If the file can't be written, an error is printed and logging is disabled.
+
+        Args:
+            text (str): The text to be written.
+        """
         if ASCIIColors.log_path!="":
             try:
-                if os.path.exists(ASCIIColors.log_path):
-                    with open(ASCIIColors.log_path,"a", encoding="utf8") as f:
-                        f.write(text+end)
-                else:
-                    with open(ASCIIColors.log_path,"w", encoding="utf8") as f:
-                        f.write(text+end)
-            except:
-                print(f"{ASCIIColors.color_bright_red}Coudln't create log file, make sure you have the permission to create it or try setting a different path.\nLogging will be disabled.{ASCIIColors.color_reset}")
-                ASCIIColors.log_path=""    
+                ASCIIColors._log_to_file(text)
+            except Exception as e:
+                print(f"{ASCIIColors.color_bright_red}Couldn't write to the log file ({e}), make sure you have the permission to create it or try setting a different path.\nLogging will be disabled.{ASCIIColors.color_reset}")
+                ASCIIColors.log_path=""
+        elif ASCIIColors._log_fd is not None:
+            with ASCIIColors._log_lock:
+                ASCIIColors._close_log_file()
+
+    @staticmethod
+    def _log_to_file(text):
+        """
+        Appends text to the log file, keeping the file open between calls.
+
+        The file (and its parent folder) is (re)opened when log_path changes, or when the file was
+        deleted or replaced behind our back (e.g. by logrotate), like logging's WatchedFileHandler.
+        Each call encodes the text once and issues a single unbuffered append, so nothing is left
+        pending in memory.
+
+        Args:
+            text (str): The text to be written.
+        """
+        data = text.encode("utf8")
+        with ASCIIColors._log_lock:
+            if ASCIIColors._log_fd is not None and ASCIIColors._log_fd_path == ASCIIColors.log_path:
+                try:
+                    path_stat = os.stat(ASCIIColors.log_path)
+                except FileNotFoundError:
+                    path_stat = None
+                fd_stat = os.fstat(ASCIIColors._log_fd)
+                if path_stat is None or (path_stat.st_dev, path_stat.st_ino) != (fd_stat.st_dev, fd_stat.st_ino):
+                    ASCIIColors._close_log_file()
+            if ASCIIColors._log_fd is None or ASCIIColors._log_fd_path != ASCIIColors.log_path:
+                ASCIIColors._close_log_file()
+                log_dir = os.path.dirname(ASCIIColors.log_path)
+                if log_dir:
+                    os.makedirs(log_dir, exist_ok=True)
+                ASCIIColors._log_fd = os.open(ASCIIColors.log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+                ASCIIColors._log_fd_path = ASCIIColors.log_path
+            while data:
+                data = data[os.write(ASCIIColors._log_fd, data):]
+
+    @staticmethod
+    def _close_log_file():
+        """
+        Closes the log file descriptor kept open by _log_to_file, if any.
+        """
+        if ASCIIColors._log_fd is not None:
+            os.close(ASCIIColors._log_fd)
+            ASCIIColors._log_fd = None
+            ASCIIColors._log_fd_path = ""
     
     @staticmethod
     def warning(text, end="\n", flush=False):
@@ -216,9 +327,21 @@ class ASCIIColors:
     
     @staticmethod
     def multicolor(texts:list, colors:list, end="\n", flush=False):
-        for text, color in zip(texts, colors):
-            ASCIIColors.print(text, color, end="", flush=True)
-        print(ASCIIColors.color_reset, color, end=end, flush=flush)
+        """
+        Prints several text segments, each with its own color, on a single line.
+
+        Args:
+            texts (list): The text segments to be printed.
+            colors (list): The color code of each segment.
+            end (str, optional): The string to print at the end. Defaults to a newline.
+            flush (bool, optional): Whether to flush the output. Defaults to False.
+        """
+        if end is None:
+            end = "\n"
+        segments = list(zip(texts, colors))
+        # Each segment is reset on its own so its color or style never leaks into the next one
+        _emit("".join([f"{color}{text}{ASCIIColors.color_reset}" for text, color in segments]) + end, flush)
+        ASCIIColors._write_log("".join([f"{text}" for text, _ in segments])+end)
 
     @staticmethod
     def bold(text, color=color_bright_red, end="\n", flush=False):
@@ -232,51 +355,113 @@ class ASCIIColors:
 
     @staticmethod
     def activate(color_or_style):
-        print(f"{color_or_style}", end="", flush=True)
+        _emit(color_or_style, True)
 
     @staticmethod
     def reset():
-        print(ASCIIColors.color_reset, end="", flush=True)
+        _emit(ASCIIColors.color_reset, True)
+
+
+    @staticmethod
+    def enable_buffering(size=8192):
+        """
+        Enables output buffering: colored text is accumulated and written to the console
+        in one go once `size` characters are pending, or when a flush is requested.
+
+        Useful for bursts of many small prints. Plain print() calls made in between are
+        not buffered and may appear before pending colored text.
+
+        Args:
+            size (int, optional): Number of characters to accumulate before writing. Defaults to 8192.
+        """
+        if not ASCIIColors._flush_at_exit_registered:
+            atexit.register(ASCIIColors._flush_at_exit)
+            ASCIIColors._flush_at_exit_registered = True
+        ASCIIColors.flush()
+        ASCIIColors._buffer_size = max(int(size), 0)
+
+    @staticmethod
+    def disable_buffering():
+        """
+        Writes any pending output and disables output buffering.
+        """
+        ASCIIColors._flush_buffer(disable=True)
+
+    @staticmethod
+    def flush():
+        """
+        Writes any pending buffered output to the console and flushes it.
+        """
+        ASCIIColors._flush_buffer()
 
+    @staticmethod
+    def _flush_buffer(disable=False):
+        """
+        Drains the output buffer to the console under the buffer lock.
+
+        Args:
+            disable (bool, optional): Whether to also disable buffering within the same critical section,
+                so no other thread can queue output that would then stay pending. Defaults to False.
+        """
+        with ASCIIColors._buffer_lock:
+            if disable:
+                ASCIIColors._buffer_size = 0
+            payload = "".join(ASCIIColors._buffer)
+            ASCIIColors._buffer.clear()
+            ASCIIColors._buffer_len = 0
+            stream = sys.stdout
+            if stream is None or getattr(stream, "closed", False):
+                return
+            if payload:
+                stream.write(payload)
+            stream.flush()
+
+    @staticmethod
+    def _flush_at_exit():
+        """
+        Exit hook registered by enable_buffering: writes output that is still pending, if any.
+        """
+        if ASCIIColors._buffer:
+            ASCIIColors._flush_buffer()
 
     @staticmethod
     def activateRed():
-        ASCIIColors.activate(ASCIIColors.color_red)
+        _emit(ASCIIColors.color_red, True)
 
     @staticmethod
     def activateGreen():
-        ASCIIColors.activate(ASCIIColors.color_green)
+        _emit(ASCIIColors.color_green, True)
 
     @staticmethod
     def activateBlue():
-        ASCIIColors.activate(ASCIIColors.color_blue)
+        _emit(ASCIIColors.color_blue, True)
 
     @staticmethod
     def activateYellow():
-        ASCIIColors.activate(ASCIIColors.color_yellow)
+        _emit(ASCIIColors.color_yellow, True)
 
     # Static methods for activating styles
     @staticmethod
     def activateBold():
-        ASCIIColors.activate(ASCIIColors.style_bold)
+        _emit(ASCIIColors.style_bold, True)
 
     @staticmethod
     def activateUnderline():
-        ASCIIColors.activate(ASCIIColors.style_underline)
+        _emit(ASCIIColors.style_underline, True)
 
     # ... Other style functions ...
 
     @staticmethod
     def resetColor():
-        ASCIIColors.activate(ASCIIColors.color_reset)
+        _emit(ASCIIColors.color_reset, True)
 
     @staticmethod
     def resetStyle():
-        ASCIIColors.activate('')  # Reset style
+        _emit('', True)  # Reset style
 
     @staticmethod
     def resetAll():
-        ASCIIColors.reset()
+        _emit(ASCIIColors.color_reset, True)
         
     @staticmethod
     def highlight(text: str, subtext: Union[str, List[str]], color: str = '\u001b[33m', highlight_color: str = '\u001b[31m', whole_line: bool = False):
@@ -294,30 +479,35 @@ class ASCIIColors:
         Returns:
         None
         """
-        if isinstance(subtext, str):
-            subtext = [subtext]
+        subtext = (subtext,) if isinstance(subtext, str) else tuple(subtext)
+
+        # A single keyword is handled with plain str operations, which beat the regex path
+        needle = subtext[0] if len(subtext) == 1 and subtext[0] else None
+        pattern = _compile_highlight(subtext) if needle is None else None
 
         if whole_line:
             lines = text.split('\n')
-            for line in lines:
-                if any(st in line for st in subtext):
-                    print(f"{highlight_color}{line}{ASCIIColors.color_reset}")
-                else:
-                    print(f"{color}{line}{ASCIIColors.color_reset}")
+            if needle is not None:
+                hits = [needle in line for line in lines]
+            elif pattern is not None:
+                hits = [pattern.search(line) is not None for line in lines]
+            else:
+                hits = [False] * len(lines)
+            _emit("\n".join([
+                f"{highlight_color if hit else color}{line}{ASCIIColors.color_reset}"
+                for line, hit in zip(lines, hits)
+            ]) + "\n")
         else:
-            for st in subtext:
-                text = text.replace(st, f'{highlight_color}{st}{color}')
-            print(f"{color}{text}{ASCIIColors.color_reset}")
+            # Keep text untouched so the log file gets the plain version
+            colored = text
+            if needle is not None:
+                colored = text.replace(needle, f'{highlight_color}{needle}{color}')
+            elif pattern is not None:
+                # Single pass over the text
+                colored = pattern.sub(lambda match: f'{highlight_color}{match.group(0)}{color}', text)
+            _emit(f"{color}{colored}{ASCIIColors.color_reset}\n")
 
-        if ASCIIColors.log_path:
-            try:
-                log_path = Path(ASCIIColors.log_path)
-                log_path.parent.mkdir(parents=True, exist_ok=True)
-                with log_path.open("a", encoding="utf8") as f:
-                    f.write(text + "\n")
-            except Exception as e:
-                print(f"{ASCIIColors.color_bright_red}Couldn't create log file: {e}{ASCIIColors.color_reset}")
-                ASCIIColors.log_path = ""
+        ASCIIColors._write_log(text + "\n")
 
     @staticmethod
     def execute_with_animation(pending_text: str, func: Callable, *args, color: Optional[str] = None, **kwargs) -> Any:
@@ -340,13 +530,17 @@ class ASCIIColors:
         
         # Default to yellow if no color is specified
         text_color = color if color else ASCIIColors.color_yellow
+
+        # Build every frame once instead of formatting a new string on each tick
+        frames = [f"\r{text_color}{pending_text} {char}{ASCIIColors.color_reset}  " for char in animation]
         
         def animate():
-            idx = 0
-            while not stop_event.is_set():
-                print(f"\r{text_color}{pending_text} {animation[idx % len(animation)]}{ASCIIColors.color_reset}  ", end="", flush=True)
+            _emit(frames[0], True)
+            idx = 1
+            # wait() doubles as the tick and the stop check: it returns True as soon as the function is done
+            while not stop_event.wait(0.1):
+                _emit(frames[idx % len(frames)], True)
                 idx += 1
-                time.sleep(0.1)
         
         animation_thread = threading.Thread(target=animate)
         animation_thread.start()
@@ -356,7 +550,7 @@ class ASCIIColors:
         finally:
             stop_event.set()
             animation_thread.join()
-            print(f"\r{' ' * (len(pending_text) + 2)}", end="\r")  # Clear the line
+            _emit(f"\r{' ' * (len(pending_text) + 2)}\r")  # Clear the line
         
         return result
 